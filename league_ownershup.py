@@ -1,30 +1,55 @@
 import requests
 import pandas as pd
+import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 round = 2
+max_workers = 32
+timeout = 15.0
+
+# One pooled session so the squad fetches reuse keep-alive connections; retry with
+# backoff since a burst of concurrent requests is likely to hit rate limits
+session = requests.Session()
+retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry),
+)
 
 url = "https://www.sofascore.com/api/v1/fantasy/league/87294/participants?page=0&q="
 
-response = requests.get(url)
+response = session.get(url, timeout=timeout)
+response.raise_for_status()
 
-participants = pd.DataFrame(response.json()["participants"])
+participants = response.json()["participants"]
 
 print(len(participants))
 
-team_info = {}
-
-for index, row in participants.iterrows():
-    user_id = row["userId"]
-    team_name = row["teamName"]
 
+def fetch_squad(user_id):
     url2 = f"https://www.sofascore.com/api/v1/fantasy/user/{user_id}/round/{802+round}/squad"
+    response2 = session.get(url2, timeout=timeout)
+    response2.raise_for_status()
+    return response2
+
+
+user_ids = [p["userId"] for p in participants]
+team_names = [p["teamName"] for p in participants]
 
-    response2 = requests.get(url2)
+# Squad requests are independent, so keep many in flight instead of one at a time
+with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    squad_responses = list(executor.map(fetch_squad, user_ids))
 
-    score = response2.json()['userRound'].get("score", 0)
-    name = response2.json()["squad"]["name"]
-    players = response2.json()["squad"]["players"]
+team_info = {}
+
+for user_id, team_name, response2 in zip(user_ids, team_names, squad_responses):
+    squad_data = response2.json()
+    score = squad_data['userRound'].get("score", 0)
+    name = squad_data["squad"]["name"]
+    players = squad_data["squad"]["players"]
     starters = []
     substitutes = []
     captain = None
@@ -51,54 +76,42 @@ for index, row in participants.iterrows():
     }
 
 
-player_team_counts = {}
-player_starters_counts = {}
-player_captains_counts = {}
-player_owners = {}
+# One row per squad member so the tallies below run as vectorized pandas ops
+squads_df = pd.DataFrame(
+    [
+        (user_id, player_id, is_starter, player_id == team_data["captain"], team_data["team_name"])
+        for user_id, team_data in team_info.items()
+        for is_starter, player_ids in ((True, team_data["starters"]), (False, team_data["substitutes"]))
+        for player_id in player_ids
+    ],
+    columns=["user_id", "player_id", "is_starter", "is_captain", "team_name"],
+)
 
-for team_id, team_data in team_info.items():
-    print(team_data["starters"])
-    for starter in team_data["starters"]:
-        if starter in player_team_counts:
-            player_team_counts[starter] += 1
-            player_owners[starter].append(team_data["team_name"])
-        else:
-            player_team_counts[starter] = 1
-            player_owners[starter] = [team_data["team_name"]]
-            
-
-    for substitute in team_data["substitutes"]:
-        if substitute in player_team_counts:
-            player_team_counts[substitute] += 1
-            player_owners[substitute].append(team_data["team_name"])
-        else:
-            player_team_counts[substitute] = 1
-            player_owners[substitute] = [team_data["team_name"]]
+player_owners = squads_df.groupby("player_id")["team_name"].agg(list)
 
-    for starter in team_data["starters"]:
-        if starter in player_starters_counts:
-            player_starters_counts[starter] += 1
-        else:
-            player_starters_counts[starter] = 1
+# print(player_owners[1156353])
 
-    if team_data["captain"] in player_captains_counts:
-        player_captains_counts[team_data["captain"]] += 1
-    else:
-        player_captains_counts[team_data["captain"]] = 1
+round_players = pd.read_csv(f'data/afcon_fantasy_market_{round}.csv')
+round_players['player_id'] = round_players['player_id'].astype('int64')
 
-# print(player_team_counts['982615'])
+# Sofascore ids run into the millions while a league owns ~100 distinct players,
+# so compress the ids first and tally over that compact range
+owned_ids, squad_idx = np.unique(squads_df["player_id"].to_numpy(dtype=np.int64), return_inverse=True)
+n_owned = len(owned_ids)
+team_counts = np.bincount(squad_idx, minlength=n_owned)
+starters_counts = np.bincount(squad_idx, weights=squads_df["is_starter"].to_numpy(), minlength=n_owned)
+captains_counts = np.bincount(squad_idx, weights=squads_df["is_captain"].to_numpy(), minlength=n_owned)
 
-# print(player_owners[1156353])
+player_team_counts = pd.Series(team_counts, index=owned_ids)
+player_starters_counts = pd.Series(starters_counts, index=owned_ids)
+player_captains_counts = pd.Series(captains_counts, index=owned_ids)
 
-sorted_player_team_counts_list = sorted(player_team_counts.items(), key=lambda x: x[1], reverse=True)
-sorted_player_team_counts_df = pd.DataFrame(sorted_player_team_counts_list, columns=["player_id", "team_count"])
-sorted_player_team_counts_dict = dict(zip(sorted_player_team_counts_df["player_id"], sorted_player_team_counts_df["team_count"]))
-# print(sorted_player_team_counts_dict)
+# print(player_team_counts[982615])
 
-round_players = pd.read_csv(f'data/afcon_fantasy_market_{round}.csv')
-round_players['league_own_pct'] = round_players['player_id'].map(sorted_player_team_counts_dict) / len(participants)
-round_players['league_start_pct'] = round_players['player_id'].map(player_starters_counts) / len(participants)
-round_players['league_cpt_pct'] = round_players['player_id'].map(player_captains_counts) / len(participants)
+inv_n = 1.0 / len(participants)
+round_players['league_own_pct'] = round_players['player_id'].map(player_team_counts).fillna(0).astype('float32') * inv_n
+round_players['league_start_pct'] = round_players['player_id'].map(player_starters_counts).fillna(0).astype('float32') * inv_n
+round_players['league_cpt_pct'] = round_players['player_id'].map(player_captains_counts).fillna(0).astype('float32') * inv_n
 
 round_players['league_owners'] = round_players['player_id'].map(player_owners)
 
@@ -109,4 +122,11 @@ edited_df['Rnd Strt'] = edited_df['Rnd Strt'].map({'starter': 1, 'substitute': 0
 
 edited_df = edited_df.sort_values(by=['League Own %', 'League Start %', 'League Cpt %', 'Global Own %', 'Total Points'], ascending=[False, False, False, False, False])
 
-edited_df.to_csv(f'data/afcon_fantasy_market_{round}_with_league_ownership.csv', index=False)
\ No newline at end of file
+csv_path = f'data/afcon_fantasy_market_{round}_with_league_ownership.csv'
+edited_df.to_csv(csv_path, index=False)
+
+# Columnar copy for the Streamlit app; converted from the CSV so both hold identical values.
+# Pos and Team are stored dictionary-encoded so the app reads them back as categoricals.
+pd.read_csv(csv_path, dtype={'Pos': 'category', 'Team': 'category'}).to_parquet(
+    csv_path.replace('.csv', '.parquet'), index=False
+)
@@ -9,9 +9,25 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import pandas as pd
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 round_id = 2
 
 
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _fixture_start_ts(fixture: Dict[str, Any]) -> Any:
+    return fixture.get("eventStartTimestamp")
+
+
 def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     """Flatten nested fantasy player data into a simple row."""
     fantasy = entry.get("fantasyPlayer") or {}
@@ -19,16 +35,13 @@ def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     team = fantasy.get("team") or entry.get("team") or {}
     fixtures = entry.get("fixtures") or []
 
-    def _ts(f: Dict[str, Any]) -> Any:
-        return f.get("eventStartTimestamp")
-
-    fixtures_sorted = sorted(
-        [f for f in fixtures if f.get("eventStartTimestamp") is not None],
-        key=_ts,
+    next_fixture = min(
+        (f for f in fixtures if f.get("eventStartTimestamp") is not None),
+        key=_fixture_start_ts,
+        default=None,
     )
-
-
-    next_fixture = fixtures_sorted[0] if fixtures_sorted else (fixtures[0] if fixtures else {})
+    if next_fixture is None:
+        next_fixture = fixtures[0] if fixtures else {}
     next_start_ts = next_fixture.get("eventStartTimestamp")
     next_fixture_team = next_fixture.get("team") or {}
 
@@ -66,11 +79,6 @@ def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
         "fixture_difficulty": next_fixture.get("fixtureDifficulty"),
         "event_id": next_fixture.get("eventId"),
         "event_start_timestamp": next_start_ts,
-        "event_start_iso_utc": (
-            datetime.utcfromtimestamp(next_start_ts).isoformat() + "Z"
-            if next_start_ts
-            else None
-        ),
         "fixtures_count": len(fixtures),
         "next_opponent": next_fixture_team.get("name"),
         "next_opponent_id": next_fixture_team.get("id"),
@@ -82,7 +90,16 @@ def normalize_market(players: Iterable[Dict[str, Any]]) -> pd.DataFrame:
     rows: List[Dict[str, Any]] = [normalize_player_entry(entry) for entry in players]
     if not rows:
         raise ValueError("No players found in the market payload.")
-    return pd.DataFrame(rows)
+    # Every row shares normalize_player_entry's key order, so build from plain
+    # tuples and skip per-row column inference.
+    df = pd.DataFrame.from_records([tuple(row.values()) for row in rows], columns=list(rows[0]))
+    # Format kickoff times for the whole column at once rather than per player
+    df.insert(
+        df.columns.get_loc("event_start_timestamp") + 1,
+        "event_start_iso_utc",
+        pd.to_datetime(df["event_start_timestamp"], unit="s").dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    )
+    return df
 
 
 def main(round_id: int) -> None:
@@ -92,11 +109,10 @@ def main(round_id: int) -> None:
 
     response = requests.get(url)
 
-    players = response.json()["players"]
+    players = _loads(response.content)["players"]
 
-    # import json
-    # with open(f"round{round_id}.json", "r") as f:
-    #     players = json.load(f)
+    # with open(f"round{round_id}.json", "rb") as f:
+    #     players = _loads(f.read())
 
     # players = players["players"]
 
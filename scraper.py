@@ -26,12 +26,15 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 ROUND_PLAYERS_URL_TEMPLATE = "https://www.sofascore.com/api/v1/fantasy/round/{round_id}/players"
@@ -66,6 +69,26 @@ def build_headers(
     return headers
 
 
+def build_session(
+    headers: Dict[str, str],
+    pool_size: int = 8,
+    max_retries: int = 3,
+) -> requests.Session:
+    """Create a session that reuses pooled connections and retries transient failures."""
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry),
+    )
+    return session
+
+
 def fetch_round_page(
     round_id: int,
     position: Optional[str],
@@ -73,7 +96,7 @@ def fetch_round_page(
     results_per_page: int,
     sort_param: str,
     sort_order: str,
-    headers: Dict[str, str],
+    session: requests.Session,
     timeout: float,
 ) -> Dict[str, Any]:
     url = ROUND_PLAYERS_URL_TEMPLATE.format(round_id=round_id)
@@ -86,49 +109,83 @@ def fetch_round_page(
     if position and position != "ALL":
         params["position"] = position
 
-    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+    response = session.get(url, params=params, timeout=timeout)
     response.raise_for_status()
     return response.json()
 
 
+def fetch_position_pages(
+    round_id: int,
+    position: str,
+    results_per_page: int,
+    sort_param: str,
+    sort_order: str,
+    session: requests.Session,
+    timeout: float,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fetch every page for a single position."""
+    players: List[Dict[str, Any]] = []
+    raw_pages: List[Dict[str, Any]] = []
+
+    page = 0
+    while True:
+        payload = fetch_round_page(
+            round_id=round_id,
+            position=position,
+            page=page,
+            results_per_page=results_per_page,
+            sort_param=sort_param,
+            sort_order=sort_order,
+            session=session,
+            timeout=timeout,
+        )
+        raw_pages.append({"position": position, "page": page, "payload": payload})
+        players.extend(payload.get("players") or [])
+
+        if not payload.get("hasNextPage"):
+            break
+        page += 1
+
+    return players, raw_pages
+
+
 def fetch_round_players(
     round_id: int,
     positions: Sequence[str],
     results_per_page: int,
     sort_param: str,
     sort_order: str,
-    headers: Dict[str, str],
+    session: requests.Session,
     timeout: float,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-    """Fetch all pages for the given positions."""
+    """Fetch all pages for the given positions, paginating positions concurrently."""
     all_players: List[Dict[str, Any]] = []
     raw_pages: List[Dict[str, Any]] = []
 
-    for pos in positions:
-        page = 0
-        while True:
-            payload = fetch_round_page(
-                round_id=round_id,
-                position=pos,
-                page=page,
-                results_per_page=results_per_page,
-                sort_param=sort_param,
-                sort_order=sort_order,
-                headers=headers,
-                timeout=timeout,
-            )
-            raw_pages.append({"position": pos, "page": page, "payload": payload})
-
-            players = payload.get("players") or []
-            all_players.extend(players)
+    def _fetch(pos: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        return fetch_position_pages(
+            round_id=round_id,
+            position=pos,
+            results_per_page=results_per_page,
+            sort_param=sort_param,
+            sort_order=sort_order,
+            session=session,
+            timeout=timeout,
+        )
 
-            if not payload.get("hasNextPage"):
-                break
-            page += 1
+    with ThreadPoolExecutor(max_workers=max(len(positions), 1)) as executor:
+        # map() yields in input order, so output matches the sequential version
+        for players, pages in executor.map(_fetch, positions):
+            all_players.extend(players)
+            raw_pages.extend(pages)
 
     return all_players, raw_pages
 
 
+def _fixture_start_ts(fixture: Dict[str, Any]) -> Any:
+    return fixture.get("eventStartTimestamp")
+
+
 def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     """Flatten nested fantasy player data into a simple row."""
     fantasy = entry.get("fantasyPlayer") or {}
@@ -136,14 +193,13 @@ def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     team = fantasy.get("team") or entry.get("team") or {}
     fixtures = entry.get("fixtures") or []
 
-    def _ts(f: Dict[str, Any]) -> Any:
-        return f.get("eventStartTimestamp")
-
-    fixtures_sorted = sorted(
-        [f for f in fixtures if f.get("eventStartTimestamp") is not None],
-        key=_ts,
+    next_fixture = min(
+        (f for f in fixtures if f.get("eventStartTimestamp") is not None),
+        key=_fixture_start_ts,
+        default=None,
     )
-    next_fixture = fixtures_sorted[0] if fixtures_sorted else (fixtures[0] if fixtures else {})
+    if next_fixture is None:
+        next_fixture = fixtures[0] if fixtures else {}
     next_start_ts = next_fixture.get("eventStartTimestamp")
     next_fixture_team = next_fixture.get("team") or {}
 
@@ -175,11 +231,6 @@ def normalize_player_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
         "fixture_difficulty": next_fixture.get("fixtureDifficulty"),
         "event_id": next_fixture.get("eventId"),
         "event_start_timestamp": next_start_ts,
-        "event_start_iso_utc": (
-            datetime.utcfromtimestamp(next_start_ts).isoformat() + "Z"
-            if next_start_ts
-            else None
-        ),
         "fixtures_count": len(fixtures),
         "next_opponent": next_fixture_team.get("name"),
         "next_opponent_id": next_fixture_team.get("id"),
@@ -191,7 +242,16 @@ def normalize_market(players: Iterable[Dict[str, Any]]) -> pd.DataFrame:
     rows: List[Dict[str, Any]] = [normalize_player_entry(entry) for entry in players]
     if not rows:
         raise ValueError("No players found in the market payload.")
-    return pd.DataFrame(rows)
+    # Every row shares normalize_player_entry's key order, so build from plain
+    # tuples and skip per-row column inference.
+    df = pd.DataFrame.from_records([tuple(row.values()) for row in rows], columns=list(rows[0]))
+    # Format kickoff times for the whole column at once rather than per player
+    df.insert(
+        df.columns.get_loc("event_start_timestamp") + 1,
+        "event_start_iso_utc",
+        pd.to_datetime(df["event_start_timestamp"], unit="s").dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    )
+    return df
 
 
 def filter_by_ownership(
@@ -277,6 +337,12 @@ def parse_args() -> argparse.Namespace:
         default=15.0,
         help="Request timeout in seconds.",
     )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=3,
+        help="Retries for connection errors and 429/5xx responses (with backoff).",
+    )
     parser.add_argument(
         "--min-ownership",
         type=float,
@@ -364,6 +430,8 @@ def main() -> None:
         extra_headers=extra_headers or None,
     )
 
+    session = build_session(headers, max_retries=args.max_retries)
+
     try:
         players, raw_pages = fetch_round_players(
             round_id=args.round_id,
@@ -371,7 +439,7 @@ def main() -> None:
             results_per_page=args.results_per_page,
             sort_param=args.sort_param,
             sort_order=args.sort_order,
-            headers=headers,
+            session=session,
             timeout=args.timeout,
         )
     except Exception as exc:
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import seaborn as sns
+import pyarrow as pa
 from datetime import datetime, timedelta
 
 # Page configuration
@@ -17,76 +17,143 @@ st.markdown("---")
 
 round = 2
 
-# Load data
-@st.cache_data
+# Rows sent to the browser per table page
+PAGE_SIZE = 200
+
+DATA_PATH = f"data/afcon_fantasy_market_{round}_with_league_ownership.parquet"
+
+# Columns shown in the table (see column_config below); kickoff times are read
+# separately by kickoff_index() since they are only used for filtering
+DISPLAY_COLS = [
+    'Player', 'Team', 'Pos', 'Price', 'Total Points', 'Round Points', 'Rnd Strt',
+    'Global Own %', 'League Own %', 'League Start %', 'League Cpt %', 'League Owners',
+]
+
+# Load data (shared read-only singleton: cache_resource skips pickling a copy per call)
+@st.cache_resource
 def load_data():
-    df = pd.read_csv(f"data/afcon_fantasy_market_{round}_with_league_ownership.csv")
-    # Convert percentage columns to numeric, handling empty strings
+    # Parquet is typed and columnar, so there is no text parsing on a cold load.
+    # Pos and Team are stored as categoricals, so filters compare integer codes.
+    df = pd.read_parquet(DATA_PATH, columns=DISPLAY_COLS, engine="pyarrow")
+    # Fill empty percentages, round, and convert from decimal to percentage in place
+    # on a single float block instead of allocating an intermediate per step
     percentage_cols = ['League Own %', 'League Start %', 'League Cpt %']
-    for col in percentage_cols:
-        df[col] = df[col].fillna(0)
-        df[col] = df[col].round(2)
-    # Multiply by 100 to convert from decimal to percentage
-    for col in percentage_cols:
-        df[col] = df[col] * 100
-    
-    # Parse Event Start Timestamp to datetime (handling UTC format with 'Z')
-    if 'Event Start Timestamp' in df.columns:
-        df['Event Start Timestamp'] = pd.to_datetime(df['Event Start Timestamp'], utc=True)
-    
+    pct = df[percentage_cols].to_numpy(dtype=np.float64, copy=True)
+    np.nan_to_num(pct, copy=False, nan=0.0)
+    pct.round(2, out=pct)
+    pct *= 100
+    df[percentage_cols] = pct
+
+    # Keep categories sorted so the sidebar options can be read straight off them
+    for col in ['Pos', 'Team']:
+        df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+
     return df
 
+# Arrow form of the table, built once; pages are taken from it directly so
+# st.dataframe skips the pandas -> Arrow conversion on every rerun
+@st.cache_resource
+def load_table():
+    return pa.Table.from_pandas(load_data(), preserve_index=False)
+
+# Row positions ordered by kickoff (rows without a kickoff are left out), so time
+# filters are two binary searches; the table itself keeps its ownership ordering
+@st.cache_resource
+def kickoff_index():
+    kickoffs = pd.read_parquet(DATA_PATH, columns=['Event Start Timestamp'], engine="pyarrow")
+    # Parse Event Start Timestamp to datetime (handling UTC format with 'Z')
+    kickoffs = pd.to_datetime(kickoffs['Event Start Timestamp'], utc=True).dt.tz_convert(None).to_numpy()
+    order = np.argsort(kickoffs, kind='stable')
+    order = order[~np.isnat(kickoffs[order])]
+    return order, kickoffs[order]
+
+# Filter data (cached per sidebar selection; the option space is small, so bound it).
+# Returns matching row positions, which are cheap to cache and index both the
+# pandas frame and the Arrow table.
+@st.cache_data(max_entries=64, show_spinner=False)
+def filter_rows(position, games, team, now_utc):
+    df = load_data()
+
+    # Apply filters as one combined mask
+    mask = np.ones(len(df), dtype=bool)
+    if position != 'All':
+        mask &= (df['Pos'] == position).to_numpy()
+
+    if games != 'All':
+        # Binary-search the kickoff window instead of comparing every row
+        order, kickoffs = kickoff_index()
+        # Filter for events within 2.5 hours before and 1 hour after current time
+        start_time = (now_utc - timedelta(hours=2.25)).tz_convert(None).to_datetime64()
+        lo = np.searchsorted(kickoffs, start_time, side='right')
+        if games == 'Current':
+            end_time = (now_utc + timedelta(hours=1)).tz_convert(None).to_datetime64()
+            hi = np.searchsorted(kickoffs, end_time, side='left')
+        else:
+            hi = len(kickoffs)
+        in_window = np.zeros(len(df), dtype=bool)
+        in_window[order[lo:hi]] = True
+        mask &= in_window
+
+    if team != 'All':
+        mask &= (df['Team'] == team).to_numpy()
+
+    return np.flatnonzero(mask)
+
+# Sidebar options (cached; they only change with the data or upstream filters)
+@st.cache_data
+def position_options():
+    df = load_data()
+    return ['All', *df['Pos'].cat.remove_unused_categories().cat.categories]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def team_options(position, games, now_utc):
+    df = load_data().iloc[filter_rows(position, games, 'All', now_utc)]
+    return ['All', *df['Team'].cat.remove_unused_categories().cat.categories]
+
 df = load_data()
 
 # Sidebar filters
 st.sidebar.header("🔍 Filters")
 
 # Position filter
-positions = ['All'] + sorted(df['Pos'].dropna().unique().tolist())
+positions = position_options()
 selected_position = st.sidebar.selectbox("Position", positions)
 
 games = ['All', 'Current', 'Remaining']
 selected_games = st.sidebar.selectbox("Games", games)
 
-# Apply filters
-filtered_df = df.copy()
-if selected_position != 'All':
-    filtered_df = filtered_df[filtered_df['Pos'] == selected_position]
-
-if selected_games == 'Current':
-    now_utc = pd.Timestamp.now(tz='UTC')
-    # Filter for events within 2.5 hours before and 1 hour after current time
-    start_time = now_utc - timedelta(hours=2.25)
-    end_time = now_utc + timedelta(hours=1)
-    filtered_df = filtered_df[(filtered_df['Event Start Timestamp'] > start_time) & (filtered_df['Event Start Timestamp'] < end_time)]
-elif selected_games == 'Remaining':
-    now_utc = pd.Timestamp.now(tz='UTC')
-    # Filter for events within 2.5 hours before and 1 hour after current time
-    start_time = now_utc - timedelta(hours=2.25)
-    filtered_df = filtered_df[(filtered_df['Event Start Timestamp'] > start_time)]
-
+# Floored to the minute so time-filtered selections hit the cache within a minute
+# but still roll forward as matches kick off
+now_utc = pd.Timestamp.now(tz='UTC').floor('1min') if selected_games != 'All' else None
 
 # Team filter
-teams = ['All'] + sorted(filtered_df['Team'].dropna().unique().tolist())
+teams = team_options(selected_position, selected_games, now_utc)
 selected_team = st.sidebar.selectbox("Team", teams)
 
-if selected_team != 'All':
-    filtered_df = filtered_df[filtered_df['Team'] == selected_team]
+filtered_rows = filter_rows(selected_position, selected_games, selected_team, now_utc)
+filtered_df = df.iloc[filtered_rows]
+
+# Page through the table so only the visible rows are serialized to the frontend
+page_count = max(1, -(-len(filtered_df) // PAGE_SIZE))
+page = st.sidebar.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+page_start = (page - 1) * PAGE_SIZE
 
 # Display stats
+owned_mask = filtered_df['League Owners'].notna().to_numpy()
 col1, col2, col3, col4, col5, col6 = st.columns(6)
 col1.metric("Total Players", len(filtered_df))
-col2.metric("Unique Teams", filtered_df['Team'].nunique())
-col3.metric("Unique Positions", filtered_df['Pos'].nunique())
-col4.metric("Players Owned", filtered_df[filtered_df['League Owners'].notna()]['Player'].nunique())
-col5.metric("Total Lge Own %", filtered_df[filtered_df['League Owners'].notna()]['League Own %'].sum().round(2))
+col2.metric("Unique Teams", filtered_df['Team'].cat.remove_unused_categories().cat.categories.size)
+col3.metric("Unique Positions", filtered_df['Pos'].cat.remove_unused_categories().cat.categories.size)
+col4.metric("Players Owned", pd.unique(filtered_df['Player'].to_numpy()[owned_mask]).size)
+col5.metric("Total Lge Own %", filtered_df['League Own %'].to_numpy()[owned_mask].sum().round(2))
 col6.metric("Total Global Own %", filtered_df['Global Own %'].sum().round(2))
 
 st.markdown("---")
 
 # 
 
-# Configure column display
+# Configure column display; ownership columns render as bars in the browser
+# instead of a Python-side Styler gradient
 column_config = {
     "Player": st.column_config.TextColumn("Player", width="medium"),
     "Team": st.column_config.TextColumn("Team", width="small"),
@@ -94,32 +161,20 @@ column_config = {
     "Price": st.column_config.NumberColumn("Price", format="%.1f"),
     "Total Points": st.column_config.NumberColumn("Total Points", format="%.1f"),
     "Round Points": st.column_config.NumberColumn("Round Points", format="%.1f"),
-    "Global Own %": st.column_config.NumberColumn("Global Own %", format="%.1f%%"),
-    "League Own %": st.column_config.NumberColumn("League Own %", format="%.1f%%"),
-    "League Start %": st.column_config.NumberColumn("League Start %", format="%.1f%%"),
-    "League Cpt %": st.column_config.NumberColumn("League Cpt %", format="%.1f%%"),
+    "Global Own %": st.column_config.ProgressColumn("Global Own %", format="%.1f%%", min_value=0, max_value=100),
+    "League Own %": st.column_config.ProgressColumn("League Own %", format="%.1f%%", min_value=0, max_value=100),
+    "League Start %": st.column_config.ProgressColumn("League Start %", format="%.1f%%", min_value=0, max_value=100),
+    "League Cpt %": st.column_config.ProgressColumn("League Cpt %", format="%.1f%%", min_value=0, max_value=100),
     "League Owners": st.column_config.TextColumn("League Owners", width="medium"),
     "Rnd Strt": st.column_config.NumberColumn("Rnd Strt", format="%.0f"),
 }
 
-# Prepare dataframe for display
-display_df = filtered_df.copy()
-
-display_df = display_df.drop(columns=['Event Start Timestamp'])
-
-# Create color map for gradient
-cm2 = sns.diverging_palette(0, 125, s=60, l=85, as_cmap=True)
-
-# Apply background gradient to percentage columns
-styled_df = display_df.style.background_gradient(
-    cmap=cm2,
-    subset=['Global Own %', 'League Own %', 'League Start %', 'League Cpt %', 'Total Points', 'Round Points', 'Rnd Strt', 'Price']
-)
+# Current page of the table, taken straight from the cached Arrow table
+page_table = load_table().take(filtered_rows[page_start:page_start + PAGE_SIZE])
 
 # Display the dataframe
-# Try with column_config first (for images), fallback to styled if needed
 st.dataframe(
-    styled_df,
+    page_table,
     column_config=column_config,
     use_container_width=True,
     hide_index=True,
@@ -128,4 +183,7 @@ st.dataframe(
 
 # Additional info
 st.markdown("---")
-st.caption(f"Showing {len(filtered_df)} of {len(df)} players")
+st.caption(
+    f"Showing {page_table.num_rows} of {len(filtered_df)} filtered players "
+    f"(page {page} of {page_count}, {len(df)} players total)"
+)